@@ -1,16 +1,44 @@
 import streamlit as st
-import pandas as pd
-import joblib
-from src.app.dashboard import render_dashboard
+from src.app.model_loader import (
+    ORG_CLASSES,
+    PRIMARY_PURPOSES,
+    combine_text,
+    predict_success,
+    unload_model,
+)
+
+TAB_BAR_CSS = """
+    <style>
+        .stTabs [data-baseweb="tab-list"] {
+            background-color: #002b80;
+            border-radius: 6px;
+            padding: 8px;
+        }
+        .stTabs [data-baseweb="tab"] {
+            color: white;
+            font-weight: 700;
+            font-size: 18px;
+            padding: 10px 16px;
+        }
+        .stTabs [aria-selected="true"] {
+            background-color: #0041cc !important;
+            border-radius: 4px;
+            color: white !important;
+        }
+    </style>
+"""
 
 # ===============================
 # Page Configuration
 # ===============================
+# The only set_page_config call: the dashboard is rendered from this script.
+# "auto" keeps the sidebar (navigation + filters) open on desktop but
+# collapsed on small screens instead of painting it and hiding it.
 st.set_page_config(
     page_title="Phase III Success Predictor",
     page_icon="🔬",
     layout="wide",
-    initial_sidebar_state="expanded"
+    initial_sidebar_state="auto"
 )
 
 # ===============================
@@ -22,55 +50,31 @@ page = st.sidebar.radio(
     index=0
 )
 
+if st.sidebar.button("Unload model", help="Free the cached model; it reloads on the next prediction"):
+    unload_model()
+
 # ===============================
 # Route to appropriate page
 # ===============================
 if page == "📊 Historical Insights":
+    from src.app.dashboard import render_dashboard
     render_dashboard()
     st.stop()
 
 # ===============================
 # Blue Tab Bar Styling
 # ===============================
-st.markdown("""
-    <style>
-        .stTabs [data-baseweb="tab-list"] {
-            background-color: #002b80;
-            border-radius: 6px;
-            padding: 8px;
-        }
-        .stTabs [data-baseweb="tab"] {
-            color: white;
-            font-weight: 700;
-            font-size: 18px;
-            padding: 10px 16px;
-        }
-        .stTabs [aria-selected="true"] {
-            background-color: #0041cc !important;
-            border-radius: 4px;
-            color: white !important;
-        }
-    </style>
-""", unsafe_allow_html=True)
-
-# ===============================
-# Load model
-# ===============================
-@st.cache_resource
-def load_model():
-    return joblib.load("model.joblib")
-
-model = load_model()
-
-# ===============================
-# Tabs
-# ===============================
-tab1, tab2 = st.tabs(["Predictor", "About Us"])
+# Emitted on every full run: Streamlit drops elements a run doesn't repeat,
+# so a once-per-session guard would lose the styling after the first rerun.
+# Predictor interactions are fragment reruns and don't resend it.
+st.markdown(TAB_BAR_CSS, unsafe_allow_html=True)
 
 # ===============================
 # TAB 1 — MAIN APP
 # ===============================
-with tab1:
+# Fragments rerun on their own, so predicting doesn't re-render About Us
+@st.fragment
+def render_predictor():
 
     # Title + Description
     st.title("Phase III Success Predictor (Oncology)")
@@ -86,85 +90,57 @@ with tab1:
     # ===============================
     st.header("Enter Phase II Trial Information")
 
-    intervention = st.text_input(
-        "Intervention(s) / Drug(s)",
-        placeholder="e.g., Nivolumab, Capecitabine + Oxaliplatin"
-    )
-
-    brief_title = st.text_input(
-        "Brief Trial Title",
-        placeholder="e.g., A Phase II Study of Nivolumab in Metastatic NSCLC"
-    )
-
-    conditions = st.text_input(
-        "Cancer Type / Condition(s)",
-        placeholder="e.g., Metastatic Non-Small Cell Lung Cancer"
-    )
-
-    outcome = st.text_area(
-        "Primary Outcome Summary",
-        placeholder="e.g., Overall Response Rate at 6 months."
-    )
-
-    org_class = st.selectbox(
-        "Sponsor Type (Organization Class)",
-        [
-            "INDUSTRY",
-            "NIH",
-            "NETWORK",
-            "OTHER",
-            "OTHER_GOV",
-            "UNKNOWN",
-            "FED",
-            "INDIV",
-        ],
-        index=0,
-    )
-
-    primary_purpose = st.selectbox(
-        "Primary Purpose",
-        [
-            "TREATMENT",
-            "PREVENTION",
-            "DIAGNOSTIC",
-            "HEALTH_SERVICES_RESEARCH",
-            "SCREENING",
-            "SUPPORTIVE_CARE",
-            "BASIC_SCIENCE",
-            "OTHER",
-            "ECT",
-            "Unknown",
-        ],
-        index=0,
-    )
+    # One rerun on submit instead of one per widget edit
+    with st.form("predict_form"):
+        intervention = st.text_input(
+            "Intervention(s) / Drug(s)",
+            placeholder="e.g., Nivolumab, Capecitabine + Oxaliplatin"
+        )
+
+        brief_title = st.text_input(
+            "Brief Trial Title",
+            placeholder="e.g., A Phase II Study of Nivolumab in Metastatic NSCLC"
+        )
+
+        conditions = st.text_input(
+            "Cancer Type / Condition(s)",
+            placeholder="e.g., Metastatic Non-Small Cell Lung Cancer"
+        )
+
+        outcome = st.text_area(
+            "Primary Outcome Summary",
+            placeholder="e.g., Overall Response Rate at 6 months."
+        )
+
+        org_class = st.selectbox(
+            "Sponsor Type (Organization Class)",
+            ORG_CLASSES,
+            index=0,
+        )
+
+        primary_purpose = st.selectbox(
+            "Primary Purpose",
+            PRIMARY_PURPOSES,
+            index=0,
+        )
+
+        submitted = st.form_submit_button("Predict Phase III Success")
 
     # ===============================
     # Predict
     # ===============================
-    if st.button("Predict Phase III Success"):
+    if submitted:
 
         if intervention.strip() == "":
             st.error("Please enter at least an intervention/drug name.")
         else:
-            combined_text = " ".join([
-                intervention.strip(),
-                brief_title.strip(),
-                conditions.strip(),
-                outcome.strip(),
-            ])
-
-            X_input = pd.DataFrame([{
-                "combined_text": combined_text,
-                "Organization Class": org_class,
-                "Primary Purpose": primary_purpose,
-            }])
-
-            # Run model
-            prob_success = model.predict_proba(X_input)[0, 1]
-            pred_label = model.predict(X_input)[0]
+            # Run model (repeat inputs are served from cache)
+            combined_text = combine_text(intervention, brief_title, conditions, outcome)
+            with st.spinner("Scoring..."):
+                prob_success, pred_label = predict_success(combined_text, org_class, primary_purpose)
 
             st.subheader("Prediction Results")
-            st.write(f"**Predicted Probability of Phase III Success:** `{prob_success:.2%}`")
+            st.metric("Predicted Probability of Phase III Success", f"{prob_success:.2%}")
 
             if pred_label == 1:
                 st.success("Model prediction: **Likely to succeed ✅**")
@@ -179,7 +155,8 @@ with tab1:
 # ===============================
 # TAB 2 — ABOUT US
 # ===============================
-with tab2:
+@st.fragment
+def render_about():
 
     st.markdown("<h1 style='text-align: center;'>About Us</h1>", unsafe_allow_html=True)
 
@@ -193,3 +170,15 @@ with tab2:
 
     st.write("""
     Our goal for this project is to build a quantitative tool that predicts the probability that a new drug candidate will succeed in Phase III trials and receive FDA approval. Typically, healthcare investors rely on subjective expert opinions and broad historical averages to guide their decisions, but these methods provide limited drug-specific insight because they ignore the candidate’s actual Phase II efficacy and safety results. Our approach is to collect past and ongoing clinical trial data, including Phase II efficacy results, safety outcomes, endpoints, and trial design details, to train a predictive model that estimates the drug-level likelihood of success. An example workflow of using our tool is that a user could input a candidate drug, and our system will compare its early-phase profile to similar historical cases to generate a dashboard filled with evidence-based probability scores, confidence intervals, and similarity metrics. In the past few weeks, our group has identified primary data sources, outlined scraping methods to fill gaps in publicly available information, and defined the core features we need to start building up our consolidated dataset for developing""")
+
+
+# ===============================
+# Tabs
+# ===============================
+tab1, tab2 = st.tabs(["Predictor", "About Us"])
+
+with tab1:
+    render_predictor()
+
+with tab2:
+    render_about()
@@ -1,8 +1,67 @@
 """Dashboard for historical Phase II to Phase III trial data."""
+import functools
+import io
+import os
+import re
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
-from src.app.data_loader import load_historical_trials
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from src.app.data_loader import CATEGORICAL_COLUMNS, load_historical_trials
+
+DATA_PATH = "data/phase2_phase3_pairs.csv"
+
+# Columns the filters, charts and table read; the cached filtered frames
+# skip the rest (primary_outcome is only needed by the CSV export)
+DASHBOARD_COLUMNS = [
+    "trial_index",
+    "organization_name",
+    "org_class",
+    "brief_title",
+    "conditions",
+    "interventions",
+    "primary_purpose",
+    "start_date",
+    "phase2_status",
+    "phase3_status",
+    "actual_success",
+    "outcome_known",
+    "outcome_label",
+    "parsed_date",
+    "year",
+    "length_category",
+]
+
+# Detailed table: source column -> header shown
+TABLE_COLUMNS = {
+    "trial_index": "Trial ID",
+    "interventions": "Intervention",
+    "conditions": "Cancer Type",
+    "brief_title": "Brief Title",
+    "org_class": "Sponsor Type",
+    "primary_purpose": "Purpose",
+    "start_date": "Start Date",
+    "outcome_label": "Phase III Outcome",
+}
+
+VIEWS = [
+    "📊 Overview",
+    "🏢 Sponsor Analysis",
+    "💊 Top Interventions",
+    "📈 Advanced Analytics",
+    "🎯 Cancer Type Deep Dive",
+    "🔬 Intervention Patterns",
+    "📅 Temporal Trends",
+    "📋 Trial Status Analysis",
+    "🌐 Organization Insights",
+    "🔗 Correlation Matrix",
+]
+
+# Intervention strings that list more than one agent
+_COMBINATION = re.compile(r",|\+|and", re.IGNORECASE)
 
 
 def render_dashboard():
@@ -10,128 +69,88 @@ def render_dashboard():
     st.title("📊 Phase II → Phase III Historical Data")
     st.markdown("Explore 6,604 historical Phase II trials and their Phase III outcomes.")
     
-    df = load_data()
+    version = data_version()
+    org_options, purpose_options, top_cancers, date_bounds = filter_options(version)
     
     # Filters
     st.sidebar.header("🔍 Filters")
     st.sidebar.info("💡 Use filters below to analyze the 6,604 historical Phase II→III trials displayed on the right")
     st.sidebar.markdown("---")
     
-    # Outcome status filter
-    outcome_status = st.sidebar.radio(
-        "Outcome Status",
-        ["All", "Success", "Failure"],
-        help="Filter trials based on Phase III outcome (success or failure)"
-    )
-    
-    # Text search
-    search = st.sidebar.text_input(
-        "🔎 Search Keywords",
-        placeholder="e.g., pembrolizumab, lung cancer...",
-        help="Search across interventions, conditions, and trial titles"
-    )
-    
-    # Sponsor filter
-    org = st.sidebar.selectbox(
-        "🏢 Sponsor Type",
-        ["All"] + sorted(df["org_class"].unique().tolist()),
-        help="Filter by organization type (INDUSTRY, NIH, etc.)"
-    )
-    
-    # Primary purpose filter
-    purpose = st.sidebar.selectbox(
-        "🎯 Primary Purpose",
-        ["All"] + sorted([x for x in df["primary_purpose"].unique() if x != "Unknown"]),
-        help="Filter by the primary purpose of the trial"
-    )
-    
-    # Outcome filter
-    outcome = st.sidebar.radio(
-        "✅ Actual Phase III Outcome",
-        ["All", "Success", "Failure"],
-        help="Filter by actual Phase III success/failure (only for trials with known outcomes)"
-    )
-    
-    # Date range filter
+    # Outside the form so ticking it shows the From/To pickers right away;
+    # inside, they'd only appear after an Apply and need a second one
     st.sidebar.markdown("📅 **Trial Start Date Range**")
     enable_date_filter = st.sidebar.checkbox("Enable date filtering", value=False)
     
-    if enable_date_filter:
-        df_with_dates = df[df["start_date"] != "Unknown"].copy()
-        df_with_dates["parsed_date"] = pd.to_datetime(df_with_dates["start_date"], errors="coerce")
-        valid_dates = df_with_dates["parsed_date"].dropna()
+    # Widgets inside a form only send their values on "Apply", so typing a
+    # search or picking several options doesn't rerun the page each time
+    with st.sidebar.form("filters"):
+        # Outcome status filter
+        outcome_status = st.radio(
+            "Outcome Status",
+            ["All", "Success", "Failure"],
+            help="Filter trials based on Phase III outcome (success or failure)"
+        )
         
-        if len(valid_dates) > 0:
-            min_date = valid_dates.min().date()
-            max_date = valid_dates.max().date()
-            
-            col1, col2 = st.sidebar.columns(2)
-            with col1:
-                start_date = st.date_input("From", min_date, min_value=min_date, max_value=max_date)
-            with col2:
-                end_date = st.date_input("To", max_date, min_value=min_date, max_value=max_date)
-            
-            date_range = (start_date, end_date)
+        # Text search
+        search = st.text_input(
+            "🔎 Search Keywords",
+            placeholder="e.g., pembrolizumab, lung cancer...",
+            help="Search across interventions, conditions, and trial titles"
+        )
+        
+        # Sponsor filter
+        org = st.selectbox(
+            "🏢 Sponsor Type",
+            org_options,
+            help="Filter by organization type (INDUSTRY, NIH, etc.)"
+        )
+        
+        # Primary purpose filter
+        purpose = st.selectbox(
+            "🎯 Primary Purpose",
+            purpose_options,
+            help="Filter by the primary purpose of the trial"
+        )
+        
+        # Outcome filter
+        outcome = st.radio(
+            "✅ Actual Phase III Outcome",
+            ["All", "Success", "Failure"],
+            help="Filter by actual Phase III success/failure (only for trials with known outcomes)"
+        )
+        
+        # Date range filter
+        if enable_date_filter:
+            if date_bounds is not None:
+                min_date, max_date = date_bounds
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    start_date = st.date_input("From", min_date, min_value=min_date, max_value=max_date)
+                with col2:
+                    end_date = st.date_input("To", max_date, min_value=min_date, max_value=max_date)
+                
+                date_range = (start_date, end_date)
+            else:
+                st.warning("No valid dates found")
+                date_range = None
         else:
-            st.sidebar.warning("No valid dates found")
             date_range = None
-    else:
-        date_range = None
-    
-    # Cancer type multi-select
-    st.sidebar.markdown("🎯 **Cancer Type Filter**")
-    top_cancers = df["conditions"].value_counts().head(20).index.tolist()
-    selected_cancers = st.sidebar.multiselect(
-        "Select cancer types (optional)",
-        top_cancers,
-        help="Filter by specific cancer types. Leave empty to show all."
-    )
-    
-    # Apply filters
-    filtered = df.copy()
-    
-    # Outcome status
-    if outcome_status == "Success":
-        filtered = filtered[filtered["actual_success"] == 1]
-    elif outcome_status == "Failure":
-        filtered = filtered[filtered["actual_success"] == 0]
-    
-    # Text search
-    if search:
-        filtered = filtered[
-            filtered["interventions"].str.contains(search, case=False, na=False) | 
-            filtered["conditions"].str.contains(search, case=False, na=False) |
-            filtered["brief_title"].str.contains(search, case=False, na=False)
-        ]
-    
-    # Sponsor type
-    if org != "All":
-        filtered = filtered[filtered["org_class"] == org]
-    
-    # Primary purpose
-    if purpose != "All":
-        filtered = filtered[filtered["primary_purpose"] == purpose]
-    
-    # Actual outcome
-    if outcome == "Success":
-        filtered = filtered[filtered["actual_success"] == 1]
-    elif outcome == "Failure":
-        filtered = filtered[filtered["actual_success"] == 0]
-    
-    # Date range
-    if date_range is not None:
-        filtered_dates = filtered[filtered["start_date"] != "Unknown"].copy()
-        filtered_dates["parsed_date"] = pd.to_datetime(filtered_dates["start_date"], errors="coerce")
-        filtered_dates = filtered_dates.dropna(subset=["parsed_date"])
-        filtered_dates = filtered_dates[
-            (filtered_dates["parsed_date"].dt.date >= date_range[0]) &
-            (filtered_dates["parsed_date"].dt.date <= date_range[1])
-        ]
-        filtered = filtered_dates
+        
+        # Cancer type multi-select
+        st.markdown("🎯 **Cancer Type Filter**")
+        selected_cancers = st.multiselect(
+            "Select cancer types (optional)",
+            top_cancers,
+            help="Filter by specific cancer types. Leave empty to show all."
+        )
+        
+        st.form_submit_button("Apply", type="primary", width="stretch")
     
-    # Cancer types
-    if selected_cancers:
-        filtered = filtered[filtered["conditions"].isin(selected_cancers)]
+    # Apply filters (cached on the filter values)
+    filters = (version, outcome_status, search, org, purpose, outcome, date_range, tuple(selected_cancers))
+    filtered = apply_filters(*filters)
     
     # Metrics with annotations
     st.markdown("### 📊 Summary Metrics")
@@ -145,7 +164,7 @@ def render_dashboard():
             help="Total number of trials matching current filters"
         )
     
-    known = filtered[filtered["outcome_known"] == True]
+    known = filtered[filtered["outcome_known"]]
     success_count = known["actual_success"].sum() if len(known) > 0 else 0
     
     with col2:
@@ -174,116 +193,65 @@ def render_dashboard():
     
     # Visualizations
     st.markdown("---")
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10 = st.tabs([
-        "📊 Overview", 
-        "🏢 Sponsor Analysis", 
-        "💊 Top Interventions", 
-        "📈 Advanced Analytics",
-        "🎯 Cancer Type Deep Dive",
-        "🔬 Intervention Patterns",
-        "📅 Temporal Trends",
-        "📋 Trial Status Analysis",
-        "🌐 Organization Insights",
-        "🔗 Correlation Matrix"
-    ])
-    
-    with tab1:
+    # Only the selected view is computed and drawn; st.tabs would build
+    # every tab's charts on each rerun just to keep the hidden ones ready
+    view = st.radio("View", VIEWS, horizontal=True, label_visibility="collapsed")
+    
+    if view == "📊 Overview":
         st.caption("📌 High-level overview of trial outcomes and success patterns across different purposes")
         col1, col2 = st.columns(2)
         with col1:
             st.markdown("#### Outcome Distribution")
             if len(filtered) > 0:
-                outcome_counts = filtered["outcome_label"].value_counts()
-                colors = {"✅ Success": "#2ca02c", "⚠️ Failure": "#d62728", "Unknown": "#7f7f7f"}
-                fig = px.pie(values=outcome_counts.values, names=outcome_counts.index, 
-                           hole=0.4, color=outcome_counts.index, color_discrete_map=colors)
-                fig.update_traces(textposition='inside', textinfo='percent+label')
-                st.plotly_chart(fig, width="stretch")
+                st.plotly_chart(outcome_pie(filters), width="stretch")
         with col2:
             st.markdown("#### Success Rate by Primary Purpose")
             if len(known) > 0:
-                purpose_stats = known.groupby("primary_purpose")["actual_success"].agg(["mean", "count"]).reset_index()
-                purpose_stats = purpose_stats[purpose_stats["count"] >= 5].sort_values("mean", ascending=False).head(10)
-                fig = px.bar(purpose_stats, x="primary_purpose", y="mean", 
-                           text=purpose_stats["mean"].apply(lambda x: f"{x:.0%}"),
-                           color="mean", color_continuous_scale="RdYlGn")
-                fig.update_yaxes(tickformat=".0%", title="Success Rate")
-                fig.update_xaxes(title="Primary Purpose")
-                fig.update_traces(textposition="outside")
-                st.plotly_chart(fig, width="stretch")
+                st.plotly_chart(purpose_success_bar(filters), width="stretch")
     
-    with tab2:
+    elif view == "🏢 Sponsor Analysis":
         st.caption("📌 Analysis of sponsor types: success rates, trial volumes, and performance comparison")
         col1, col2 = st.columns(2)
         with col1:
             st.markdown("#### Success Rate by Sponsor Type")
             if len(known) > 0:
-                sponsor_stats = known.groupby("org_class")["actual_success"].agg(["mean", "count"]).reset_index()
-                if len(sponsor_stats) > 0:
-                    sponsor_stats = sponsor_stats.sort_values("mean", ascending=False)
-                    fig = px.bar(sponsor_stats, x="org_class", y="mean", 
-                               text=sponsor_stats["mean"].apply(lambda x: f"{x:.0%}"),
-                               color="mean", color_continuous_scale="Viridis",
-                               labels={"org_class": "Sponsor Type", "mean": "Success Rate"})
-                    fig.update_yaxes(tickformat=".0%")
-                    fig.update_traces(textposition="outside")
-                    st.plotly_chart(fig, width="stretch")
+                if len(success_stats(filters, "org_class")) > 0:
+                    st.plotly_chart(sponsor_success_bar(filters), width="stretch")
                 else:
                     st.info("No data available for this filter combination")
         with col2:
             st.markdown("#### Trial Volume by Sponsor")
             if len(filtered) > 0:
-                sponsor_counts = filtered["org_class"].value_counts().head(10)
-                if len(sponsor_counts) > 0:
-                    fig = px.bar(x=sponsor_counts.index, y=sponsor_counts.values,
-                               labels={"x": "Sponsor Type", "y": "Number of Trials"},
-                               color=sponsor_counts.values, color_continuous_scale="Blues")
-                    fig.update_traces(text=sponsor_counts.values, textposition="outside")
-                    st.plotly_chart(fig, width="stretch")
+                if len(column_counts(filters, "org_class")) > 0:
+                    st.plotly_chart(sponsor_volume_bar(filters), width="stretch")
                 else:
                     st.info("No data available")
             else:
                 st.info("No data available")
     
-    with tab3:
+    elif view == "💊 Top Interventions":
         st.markdown("#### Top 20 Interventions by Frequency")
         if len(filtered) > 0:
-            intervention_counts = filtered["interventions"].value_counts().head(20)
-            if len(intervention_counts) > 0:
-                fig = px.bar(y=intervention_counts.index, x=intervention_counts.values, orientation="h",
-                           labels={"x": "Number of Trials", "y": "Intervention"},
-                           color=intervention_counts.values, color_continuous_scale="Oranges")
-                fig.update_traces(text=intervention_counts.values, textposition="outside")
-                fig.update_layout(height=600, showlegend=False)
-                st.plotly_chart(fig, width="stretch")
-            else:
-                st.info("No intervention data available")
+            fig = count_bar_chart(filters, "interventions", 20, "Intervention", "Oranges", 600)
+            st.plotly_chart(fig, width="stretch")
         else:
             st.info("No data available")
         
         st.markdown("#### Top 20 Cancer Types by Frequency")
         if len(filtered) > 0:
-            condition_counts = filtered["conditions"].value_counts().head(20)
-            if len(condition_counts) > 0:
-                fig = px.bar(y=condition_counts.index, x=condition_counts.values, orientation="h",
-                           labels={"x": "Number of Trials", "y": "Cancer Type"},
-                           color=condition_counts.values, color_continuous_scale="Purples")
-                fig.update_traces(text=condition_counts.values, textposition="outside")
-                fig.update_layout(height=600, showlegend=False)
-                st.plotly_chart(fig, width="stretch")
-            else:
-                st.info("No cancer type data available")
+            fig = count_bar_chart(filters, "conditions", 20, "Cancer Type", "Purples", 600)
+            st.plotly_chart(fig, width="stretch")
         else:
             st.info("No data available")
     
-    with tab4:
+    elif view == "📈 Advanced Analytics":
         st.markdown("#### Statistical Analysis")
         
         col1, col2 = st.columns(2)
         with col1:
             st.markdown("##### Success Rate Distribution by Sponsor")
             if len(known) > 0:
-                sponsor_success = known.groupby("org_class")["actual_success"].agg(["mean", "count", "std"]).reset_index()
+                sponsor_success = success_stats(filters, "org_class")
                 if len(sponsor_success) > 0:
                     sponsor_success["std"] = sponsor_success["std"].fillna(0)
                     fig = px.scatter(sponsor_success, x="count", y="mean", size="count", 
@@ -299,62 +267,35 @@ def render_dashboard():
         
         with col2:
             st.markdown("##### Trials Over Time")
-            df_dates = filtered[filtered["start_date"] != "Unknown"].copy()
-            if len(df_dates) > 0:
-                df_dates["year"] = pd.to_datetime(df_dates["start_date"], errors="coerce").dt.year
-                df_dates = df_dates.dropna(subset=["year"])
-                if len(df_dates) > 0:
-                    yearly = df_dates.groupby("year").size().reset_index(name="count")
-                    fig = px.line(yearly, x="year", y="count", markers=True,
-                                labels={"year": "Year", "count": "Number of Trials"})
-                    fig.update_traces(line=dict(width=3))
-                    st.plotly_chart(fig, width="stretch")
+            yearly = yearly_counts(filters)
+            if len(yearly) > 0:
+                fig = px.line(yearly, x="year", y="count", markers=True,
+                            labels={"year": "Year", "count": "Number of Trials"})
+                fig.update_traces(line=dict(width=3))
+                st.plotly_chart(fig, width="stretch")
         
         st.markdown("##### Success Rate Comparison: Top Interventions")
         if len(known) > 0:
-            # Get top 15 interventions by frequency
-            top_interventions = known["interventions"].value_counts().head(15).index
-            if len(top_interventions) > 0:
-                intervention_success = known[known["interventions"].isin(top_interventions)].groupby("interventions")["actual_success"].agg(["mean", "count"]).reset_index()
-                if len(intervention_success) > 0:
-                    intervention_success = intervention_success.sort_values("mean", ascending=True)
-                    
-                    fig = px.bar(intervention_success, y="interventions", x="mean", orientation="h",
-                               text=intervention_success["mean"].apply(lambda x: f"{x:.0%}"),
-                               color="mean", color_continuous_scale="RdYlGn",
-                               labels={"mean": "Success Rate", "interventions": "Intervention"})
-                    fig.update_xaxes(tickformat=".0%")
-                    fig.update_traces(textposition="outside")
-                    fig.update_layout(height=500)
-                    st.plotly_chart(fig, width="stretch")
-                else:
-                    st.info("Insufficient intervention data")
+            if len(success_stats(filters, "interventions")) > 0:
+                st.plotly_chart(intervention_success_bar(filters), width="stretch")
             else:
                 st.info("No interventions found")
         else:
             st.info("No trials with known outcomes")
     
-    with tab5:
+    elif view == "🎯 Cancer Type Deep Dive":
         st.caption("📌 Comprehensive cancer type analysis: success rates, volumes, and distribution patterns")
         st.markdown("#### 🎯 Cancer Type Deep Dive")
         
         # Full width horizontal bar chart for better readability
+        # One per-condition table feeds both charts below (>= 5 and >= 3 trials)
+        condition_stats = success_stats(filters, "conditions")
+        
         st.markdown("##### Top 15 Cancer Types by Success Rate")
         if len(known) > 0:
-            # Filter to cancer types with at least 5 trials
-            cancer_stats = known.groupby("conditions")["actual_success"].agg(["mean", "count"]).reset_index()
-            cancer_stats = cancer_stats[cancer_stats["count"] >= 5].sort_values("mean", ascending=True).head(15)
-            
-            if len(cancer_stats) > 0:
-                fig = px.bar(cancer_stats, y="conditions", x="mean", orientation="h",
-                           text=cancer_stats["mean"].apply(lambda x: f"{x:.0%}"),
-                           color="mean", color_continuous_scale="Viridis",
-                           labels={"conditions": "Cancer Type", "mean": "Success Rate"})
-                fig.update_xaxes(tickformat=".0%", title="Success Rate")
-                fig.update_yaxes(title="")
-                fig.update_traces(textposition="outside")
-                fig.update_layout(height=600, showlegend=False)
-                st.plotly_chart(fig, width="stretch")
+            # Only cancer types with at least 5 trials are charted
+            if (condition_stats["count"] >= 5).any():
+                st.plotly_chart(cancer_success_bar(filters), width="stretch")
             else:
                 st.info("Insufficient cancer type data (need at least 5 trials per type)")
         else:
@@ -366,8 +307,7 @@ def render_dashboard():
         with col1:
             st.markdown("##### Trial Volume vs Success Rate")
             if len(known) > 0:
-                cancer_bubble = known.groupby("conditions")["actual_success"].agg(["mean", "count"]).reset_index()
-                cancer_bubble = cancer_bubble[cancer_bubble["count"] >= 3]
+                cancer_bubble = condition_stats[condition_stats["count"] >= 3]
                 
                 if len(cancer_bubble) > 0:
                     fig = px.scatter(cancer_bubble, x="count", y="mean", size="count",
@@ -386,40 +326,20 @@ def render_dashboard():
         with col2:
             st.markdown("##### Cancer Type Distribution (Treemap)")
             if len(filtered) > 0:
-                cancer_treemap = filtered["conditions"].value_counts().head(30).reset_index()
-                if len(cancer_treemap) > 0:
-                    cancer_treemap.columns = ["condition", "count"]
-                    fig = px.treemap(cancer_treemap, path=["condition"], values="count",
-                                   color="count", color_continuous_scale="Greens",
-                                   labels={"count": "Number of Trials"})
-                    fig.update_layout(height=500)
-                    st.plotly_chart(fig, width="stretch")
-                else:
-                    st.info("No cancer type data")
+                st.plotly_chart(conditions_treemap(filters), width="stretch")
             else:
                 st.info("No data available")
     
-    with tab6:
+    elif view == "🔬 Intervention Patterns":
         st.markdown("#### 🔬 Intervention Patterns")
         
         st.markdown("##### Combination vs Single Agent Therapies")
         if len(known) > 0:
-            # Identify combination therapies
-            known_copy = known.copy()
-            known_copy["is_combination"] = known_copy["interventions"].str.contains(",|\\+|and", case=False, na=False)
-            combo_stats = known_copy.groupby("is_combination")["actual_success"].agg(["mean", "count"]).reset_index()
-            combo_stats["therapy_type"] = combo_stats["is_combination"].map({True: "Combination", False: "Single Agent"})
+            combo_stats = combination_stats(filters)
             
             col1, col2 = st.columns(2)
             with col1:
-                fig = px.bar(combo_stats, x="therapy_type", y="mean",
-                           text=combo_stats["mean"].apply(lambda x: f"{x:.0%}"),
-                           color="mean", color_continuous_scale="RdYlGn",
-                           labels={"therapy_type": "Therapy Type", "mean": "Success Rate"})
-                fig.update_yaxes(tickformat=".0%")
-                fig.update_traces(textposition="outside")
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, width="stretch")
+                st.plotly_chart(combination_success_bar(filters), width="stretch")
             
             with col2:
                 fig = px.pie(combo_stats, values="count", names="therapy_type",
@@ -430,117 +350,72 @@ def render_dashboard():
         
         st.markdown("##### Most Common Intervention Keywords")
         if len(filtered) > 0:
-            # Extract keywords from interventions
-            all_interventions = " ".join(filtered["interventions"].str.lower()).split()
-            # Filter out common words and count
-            from collections import Counter
-            keyword_counts = Counter([word.strip(",.+-") for word in all_interventions if len(word) > 3])
-            top_keywords = pd.DataFrame(keyword_counts.most_common(30), columns=["keyword", "count"])
-            
-            fig = px.bar(top_keywords, y="keyword", x="count", orientation="h",
-                       color="count", color_continuous_scale="Plasma",
-                       labels={"keyword": "Keyword", "count": "Frequency"})
-            fig.update_layout(height=600, showlegend=False)
-            fig.update_traces(textposition="outside", text=top_keywords["count"])
-            st.plotly_chart(fig, width="stretch")
+            st.plotly_chart(keyword_bar(filters, 30), width="stretch")
     
-    with tab7:
+    elif view == "📅 Temporal Trends":
         st.caption("📌 Historical trends: trial volumes over time, success rate evolution, and sponsor activity patterns")
         st.markdown("#### 📅 Temporal Trends Analysis")
         
-        df_dates = filtered[filtered["start_date"] != "Unknown"].copy()
-        if len(df_dates) > 0:
-            df_dates["year"] = pd.to_datetime(df_dates["start_date"], errors="coerce").dt.year
-            df_dates = df_dates.dropna(subset=["year"])
+        yearly = yearly_counts(filters)
+        if len(yearly) > 0:
+            col1, col2 = st.columns(2)
             
-            if len(df_dates) > 0:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("##### Trial Starts by Year")
-                    yearly_counts = df_dates.groupby("year").size().reset_index(name="count")
-                    fig = px.area(yearly_counts, x="year", y="count",
-                                labels={"year": "Year", "count": "Number of Trials"},
-                                color_discrete_sequence=["#636EFA"])
-                    fig.update_traces(line=dict(width=2))
-                    fig.update_layout(height=400)
-                    st.plotly_chart(fig, width="stretch")
-                
-                with col2:
-                    st.markdown("##### Success Rate Over Time")
-                    df_dates_known = df_dates[df_dates["outcome_known"] == True]
-                    if len(df_dates_known) > 0:
-                        yearly_success = df_dates_known.groupby("year")["actual_success"].agg(["mean", "count"]).reset_index()
-                        yearly_success = yearly_success[yearly_success["count"] >= 3]
-                        
-                        fig = px.line(yearly_success, x="year", y="mean", markers=True,
-                                    labels={"year": "Year", "mean": "Success Rate"})
-                        fig.update_yaxes(tickformat=".0%")
-                        fig.update_traces(line=dict(width=3, color="#00CC96"))
-                        fig.update_layout(height=400)
-                        st.plotly_chart(fig, width="stretch")
-                
-                st.markdown("##### Sponsor Activity Over Time")
-                sponsor_yearly = df_dates.groupby(["year", "org_class"]).size().reset_index(name="count")
-                top_sponsors = df_dates["org_class"].value_counts().head(5).index
-                sponsor_yearly_top = sponsor_yearly[sponsor_yearly["org_class"].isin(top_sponsors)]
-                
-                fig = px.line(sponsor_yearly_top, x="year", y="count", color="org_class",
-                            labels={"year": "Year", "count": "Number of Trials", "org_class": "Sponsor Type"},
-                            markers=True)
+            with col1:
+                st.markdown("##### Trial Starts by Year")
+                fig = px.area(yearly, x="year", y="count",
+                            labels={"year": "Year", "count": "Number of Trials"},
+                            color_discrete_sequence=["#636EFA"])
                 fig.update_traces(line=dict(width=2))
-                fig.update_layout(height=450)
+                fig.update_layout(height=400)
                 st.plotly_chart(fig, width="stretch")
+            
+            with col2:
+                st.markdown("##### Success Rate Over Time")
+                yearly_success = success_stats(filters, "year")
+                if len(yearly_success) > 0:
+                    yearly_success = yearly_success[yearly_success["count"] >= 3]
+                    
+                    fig = px.line(yearly_success, x="year", y="mean", markers=True,
+                                labels={"year": "Year", "mean": "Success Rate"})
+                    fig.update_yaxes(tickformat=".0%")
+                    fig.update_traces(line=dict(width=3, color="#00CC96"))
+                    fig.update_layout(height=400)
+                    st.plotly_chart(fig, width="stretch")
+            
+            st.markdown("##### Sponsor Activity Over Time")
+            sponsor_yearly_top = sponsor_yearly_counts(filters, 5)
+            
+            fig = px.line(sponsor_yearly_top, x="year", y="count", color="org_class",
+                        labels={"year": "Year", "count": "Number of Trials", "org_class": "Sponsor Type"},
+                        markers=True)
+            fig.update_traces(line=dict(width=2))
+            fig.update_layout(height=450)
+            st.plotly_chart(fig, width="stretch")
     
-    with tab8:
+    elif view == "📋 Trial Status Analysis":
         st.markdown("#### 📋 Trial Status Analysis")
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("##### Phase II Status Distribution")
-            phase2_counts = filtered["phase2_status"].value_counts().head(10)
-            fig = px.bar(x=phase2_counts.values, y=phase2_counts.index, orientation="h",
-                       color=phase2_counts.values, color_continuous_scale="Blues",
-                       labels={"x": "Number of Trials", "y": "Phase II Status"})
-            fig.update_traces(text=phase2_counts.values, textposition="outside")
-            fig.update_layout(height=400, showlegend=False)
+            fig = count_bar_chart(filters, "phase2_status", 10, "Phase II Status", "Blues", 400)
             st.plotly_chart(fig, width="stretch")
         
         with col2:
             st.markdown("##### Phase III Status Distribution")
-            phase3_counts = filtered["phase3_status"].value_counts().head(10)
-            fig = px.bar(x=phase3_counts.values, y=phase3_counts.index, orientation="h",
-                       color=phase3_counts.values, color_continuous_scale="Reds",
-                       labels={"x": "Number of Trials", "y": "Phase III Status"})
-            fig.update_traces(text=phase3_counts.values, textposition="outside")
-            fig.update_layout(height=400, showlegend=False)
+            fig = count_bar_chart(filters, "phase3_status", 10, "Phase III Status", "Reds", 400)
             st.plotly_chart(fig, width="stretch")
         
         st.markdown("##### Success Rate by Phase II Status")
         if len(known) > 0:
-            phase2_success = known.groupby("phase2_status")["actual_success"].agg(["mean", "count"]).reset_index()
-            phase2_success = phase2_success[phase2_success["count"] >= 5].sort_values("mean", ascending=False)
-            
-            fig = px.bar(phase2_success, x="phase2_status", y="mean",
-                       text=phase2_success["mean"].apply(lambda x: f"{x:.0%}"),
-                       color="mean", color_continuous_scale="RdYlGn",
-                       labels={"phase2_status": "Phase II Status", "mean": "Success Rate"})
-            fig.update_yaxes(tickformat=".0%")
-            fig.update_traces(textposition="outside")
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, width="stretch")
+            st.plotly_chart(phase2_success_bar(filters), width="stretch")
     
-    with tab9:
+    elif view == "🌐 Organization Insights":
         st.markdown("#### 🌐 Organization Insights")
         
         st.markdown("##### Top 20 Organizations by Trial Volume")
-        org_counts = filtered["organization_name"].value_counts().head(20)
-        fig = px.bar(y=org_counts.index, x=org_counts.values, orientation="h",
-                   color=org_counts.values, color_continuous_scale="Teal",
-                   labels={"x": "Number of Trials", "y": "Organization"})
-        fig.update_traces(text=org_counts.values, textposition="outside")
-        fig.update_layout(height=600, showlegend=False)
+        fig = count_bar_chart(filters, "organization_name", 20, "Organization", "Teal", 600)
         st.plotly_chart(fig, width="stretch")
         
         col1, col2 = st.columns(2)
@@ -548,27 +423,12 @@ def render_dashboard():
         with col1:
             st.markdown("##### Success Rate by Top Organizations")
             if len(known) > 0:
-                top_orgs = known["organization_name"].value_counts().head(15).index
-                org_success = known[known["organization_name"].isin(top_orgs)].groupby("organization_name")["actual_success"].agg(["mean", "count"]).reset_index()
-                org_success = org_success[org_success["count"] >= 3].sort_values("mean", ascending=False).head(10)
-                
-                fig = px.bar(org_success, x="organization_name", y="mean",
-                           text=org_success["mean"].apply(lambda x: f"{x:.0%}"),
-                           color="mean", color_continuous_scale="Viridis",
-                           labels={"organization_name": "Organization", "mean": "Success Rate"})
-                fig.update_yaxes(tickformat=".0%")
-                fig.update_xaxes(tickangle=-45)
-                fig.update_traces(textposition="outside")
-                fig.update_layout(height=450)
-                st.plotly_chart(fig, width="stretch")
+                st.plotly_chart(organization_success_bar(filters), width="stretch")
         
         with col2:
             st.markdown("##### Organization Type Performance")
             if len(known) > 0:
-                org_type_perf = known.groupby("org_class").agg({
-                    "actual_success": ["mean", "count", "std"]
-                }).reset_index()
-                org_type_perf.columns = ["org_class", "mean", "count", "std"]
+                org_type_perf = success_stats(filters, "org_class")
                 org_type_perf["std"] = org_type_perf["std"].fillna(0)
                 
                 fig = px.scatter(org_type_perf, x="mean", y="count", size="count",
@@ -580,61 +440,24 @@ def render_dashboard():
                 fig.update_layout(height=450)
                 st.plotly_chart(fig, width="stretch")
     
-    with tab10:
+    elif view == "🔗 Correlation Matrix":
         st.caption("📌 Advanced pattern recognition: cross-variable correlations and hidden relationships in the data")
         st.markdown("#### 🔗 Correlation & Pattern Analysis")
         
         if len(known) > 0:
             st.markdown("##### Success Rate Heatmap: Purpose × Sponsor")
             
-            # Create pivot table
-            heatmap_data = known.groupby(["primary_purpose", "org_class"])["actual_success"].agg(["mean", "count"]).reset_index()
-            heatmap_data = heatmap_data[heatmap_data["count"] >= 3]
-            
-            # Pivot for heatmap
-            heatmap_pivot = heatmap_data.pivot(index="primary_purpose", columns="org_class", values="mean")
-            
-            fig = px.imshow(heatmap_pivot, 
-                          labels=dict(x="Sponsor Type", y="Primary Purpose", color="Success Rate"),
-                          color_continuous_scale="RdYlGn",
-                          aspect="auto")
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, width="stretch")
+            st.plotly_chart(purpose_sponsor_heatmap(filters), width="stretch")
             
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("##### Intervention Length Impact")
-                known_copy = known.copy()
-                known_copy["intervention_length"] = known_copy["interventions"].str.len()
-                known_copy["length_category"] = pd.cut(known_copy["intervention_length"], 
-                                                       bins=[0, 20, 40, 60, 1000],
-                                                       labels=["Short", "Medium", "Long", "Very Long"])
-                
-                length_stats = known_copy.groupby("length_category", observed=False)["actual_success"].agg(["mean", "count"]).reset_index()
-                
-                fig = px.bar(length_stats, x="length_category", y="mean",
-                           text=length_stats["mean"].apply(lambda x: f"{x:.0%}"),
-                           color="mean", color_continuous_scale="Cividis",
-                           labels={"length_category": "Intervention Name Length", "mean": "Success Rate"})
-                fig.update_yaxes(tickformat=".0%")
-                fig.update_traces(textposition="outside")
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, width="stretch")
+                st.plotly_chart(length_success_bar(filters), width="stretch")
             
             with col2:
                 st.markdown("##### Purpose Diversity by Sponsor")
-                purpose_diversity = filtered.groupby("org_class")["primary_purpose"].nunique().reset_index()
-                purpose_diversity.columns = ["org_class", "num_purposes"]
-                purpose_diversity = purpose_diversity.sort_values("num_purposes", ascending=False)
-                
-                fig = px.bar(purpose_diversity, x="org_class", y="num_purposes",
-                           text="num_purposes",
-                           color="num_purposes", color_continuous_scale="Sunset",
-                           labels={"org_class": "Sponsor Type", "num_purposes": "Number of Different Purposes"})
-                fig.update_traces(textposition="outside")
-                fig.update_layout(height=400, showlegend=False)
-                st.plotly_chart(fig, width="stretch")
+                st.plotly_chart(purpose_diversity_bar(filters), width="stretch")
     
     # Table
     st.markdown("---")
@@ -645,31 +468,19 @@ def render_dashboard():
     if len(filtered) > max_display:
         st.warning(f"⚠️ Showing first {max_display} of {len(filtered):,} trials. Use filters to narrow results or download CSV for full data.")
         display_df = filtered.head(max_display)
+        # head() keeps every category of the filtered frame; trim them to the
+        # shown rows so the grid isn't sent all ~1,200 cancer types as a dictionary
+        display_df = display_df.assign(**{
+            col: display_df[col].cat.remove_unused_categories()
+            for col in CATEGORICAL_COLUMNS if col in TABLE_COLUMNS
+        })
     else:
         st.caption(f"📌 Displaying all {len(filtered):,} trials matching your filters. Click column headers to sort.")
         display_df = filtered
     
-    display = display_df[[
-        "trial_index", 
-        "interventions", 
-        "conditions", 
-        "brief_title", 
-        "org_class", 
-        "primary_purpose", 
-        "start_date",
-        "outcome_label"
-    ]].copy()
-    
-    display.columns = [
-        "Trial ID", 
-        "Intervention", 
-        "Cancer Type", 
-        "Brief Title", 
-        "Sponsor Type", 
-        "Purpose",
-        "Start Date",
-        "Phase III Outcome"
-    ]
+    # Select and rename without copying; pandas' copy-on-write shares the
+    # column data with the cached frame and st.dataframe doesn't modify it
+    display = display_df.loc[:, list(TABLE_COLUMNS)].rename(columns=TABLE_COLUMNS)
     
     st.dataframe(
         display, 
@@ -693,12 +504,12 @@ def render_dashboard():
     st.caption("📌 Download the current filtered dataset for external analysis")
     
     if len(filtered) > 0:
-        csv = filtered.to_csv(index=False)
         col1, col2, col3 = st.columns([2, 1, 2])
         with col2:
+            # Built only when the button is clicked, not on every rerun
             st.download_button(
                 "📥 Download as CSV",
-                csv,
+                functools.partial(export_csv, filters),
                 "filtered_trials.csv",
                 "text/csv",
                 use_container_width=True
@@ -707,6 +518,416 @@ def render_dashboard():
         st.warning("⚠️ No trials to export. Adjust your filters to see results.")
 
 
+def data_version():
+    """Modification time of the trials CSV; part of every cache key below."""
+    return os.path.getmtime(DATA_PATH)
+
+
+@st.cache_data
+def load_data(version):
+    return load_historical_trials(DATA_PATH)
+
+
 @st.cache_data
-def load_data():
-    return load_historical_trials()
+def filter_options(version):
+    """
+    Choices for the sidebar filters, which only depend on the source data.
+    
+    Returns:
+        ("All" + sponsor types, "All" + primary purposes, 20 most common cancer types,
+        (first, last) start date or None)
+    """
+    df = load_data(version)
+    # Categories of the categorical columns, so no pass over the rows
+    org_options = ("All",) + tuple(sorted(df["org_class"].cat.categories))
+    purpose_options = ("All",) + tuple(sorted(x for x in df["primary_purpose"].cat.categories if x != "Unknown"))
+    top_cancers = df["conditions"].value_counts().head(20).index.tolist()
+    valid_dates = df["parsed_date"].dropna()
+    date_bounds = (valid_dates.min().date(), valid_dates.max().date()) if len(valid_dates) > 0 else None
+    return org_options, purpose_options, top_cancers, date_bounds
+
+
+# Every filter-keyed cache is bounded: the key includes the free-text search,
+# so unbounded caches would keep one entry per query for the server's lifetime.
+# Whole frames / CSV exports (~2 MB each) get smaller caps than aggregates
+@st.cache_data(show_spinner=False, max_entries=64)
+def apply_filters(version, outcome_status, search, org, purpose, outcome, date_range, cancers):
+    """Apply the sidebar filters; cached on the filter values, not the DataFrame."""
+    df = load_data(version)
+    
+    # AND every active filter into one mask, then slice the frame once
+    mask = np.ones(len(df), dtype=bool)
+    
+    # Outcome status
+    if outcome_status == "Success":
+        mask &= (df["actual_success"] == 1).to_numpy()
+    elif outcome_status == "Failure":
+        mask &= (df["actual_success"] == 0).to_numpy()
+    
+    # Text search (one pass over the pre-joined text columns)
+    if search:
+        needle = search.lower()
+        texts = search_blob(version)
+        mask &= np.fromiter((needle in text for text in texts), dtype=bool, count=len(texts))
+    
+    # Sponsor type
+    if org != "All":
+        mask &= (df["org_class"] == org).to_numpy()
+    
+    # Primary purpose
+    if purpose != "All":
+        mask &= (df["primary_purpose"] == purpose).to_numpy()
+    
+    # Actual outcome
+    if outcome == "Success":
+        mask &= (df["actual_success"] == 1).to_numpy()
+    elif outcome == "Failure":
+        mask &= (df["actual_success"] == 0).to_numpy()
+    
+    # Date range
+    if date_range is not None:
+        start, end = (pd.Timestamp(d) for d in date_range)
+        mask &= df["parsed_date"].between(start, end).to_numpy()
+    
+    # Cancer types
+    if cancers:
+        mask &= df["conditions"].isin(cancers).to_numpy()
+    
+    filtered = df.loc[mask, DASHBOARD_COLUMNS]
+    
+    # Drop categories with no rows left so value_counts() doesn't list them
+    return filtered.assign(**{col: filtered[col].cat.remove_unused_categories() for col in CATEGORICAL_COLUMNS})
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def export_csv(filters):
+    """CSV (bytes) of every source column for the filtered trials, written by Arrow's C++ CSV writer."""
+    df = load_data(filters[0])
+    export = df.loc[apply_filters(*filters).index].drop(columns=["parsed_date", "year", "intervention_length", "length_category"])
+    buf = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(export, preserve_index=False), buf)
+    return buf.getvalue()
+
+
+@st.cache_resource(show_spinner=False)
+def search_blob(version):
+    """
+    Lower-cased interventions/conditions/title per trial, for the keyword search.
+    
+    Kept as a read-only array of Python str shared by all sessions (no cache
+    copy per call): testing a lower-cased needle with the `in` operator on
+    these is about twice as fast as str.contains over the Arrow column.
+    """
+    df = load_data(version)
+    # Unit separator keeps a keyword from matching across field boundaries
+    conditions = df["conditions"].astype("string[pyarrow]")
+    texts = (df["interventions"] + "\x1f" + conditions + "\x1f" + df["brief_title"]).str.lower()
+    texts = texts.to_numpy(dtype=object)
+    texts.flags.writeable = False
+    return texts
+
+
+@st.cache_data(show_spinner=False)
+def combination_mask(version):
+    """True for trials whose intervention looks like a combination therapy."""
+    df = load_data(version)
+    return df["interventions"].str.contains(_COMBINATION, na=False).rename("is_combination")
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def keyword_counts(filters, n):
+    """
+    Most frequent words (longer than 3 characters) in the filtered interventions.
+    
+    Tokenises with Arrow string kernels instead of joining every intervention
+    into one Python string and counting the pieces in a Counter.
+    
+    Returns:
+        pd.DataFrame with keyword and count columns, ties in first-seen order
+    """
+    interventions = pa.array(apply_filters(*filters)["interventions"], from_pandas=True)
+    words = pc.list_flatten(pc.utf8_split_whitespace(pc.utf8_lower(interventions)))
+    words = pc.utf8_trim(words.filter(pc.greater(pc.utf8_length(words), 3)), ",.+-")
+    counts = pc.value_counts(words)
+    top = np.argsort(-counts.field("counts").to_numpy(), kind="stable")[:n]
+    return pd.DataFrame({
+        "keyword": counts.field("values").take(top).to_pylist(),
+        "count": counts.field("counts").take(top).to_numpy(),
+    })
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def column_counts(filters, column):
+    """value_counts() of one column of the filtered trials; charts take their own head(n)."""
+    return apply_filters(*filters)[column].value_counts()
+
+
+# Figures below are built once per filter set and shared by every session;
+# st.plotly_chart only serialises them, so handing out the same object is safe
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def outcome_pie(filters):
+    """Donut of success / failure / unknown outcomes for the filtered trials."""
+    outcome_counts = column_counts(filters, "outcome_label")
+    colors = {"✅ Success": "#2ca02c", "⚠️ Failure": "#d62728", "Unknown": "#7f7f7f"}
+    fig = px.pie(values=outcome_counts.values, names=outcome_counts.index, 
+               hole=0.4, color=outcome_counts.index, color_discrete_map=colors)
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def count_bar_chart(filters, column, n, label, color_scale, height):
+    """Horizontal bar chart of the n most common values of a column in the filtered trials."""
+    counts = column_counts(filters, column).head(n)
+    fig = px.bar(y=counts.index, x=counts.values, orientation="h",
+               labels={"x": "Number of Trials", "y": label},
+               color=counts.values, color_continuous_scale=color_scale)
+    fig.update_traces(text=counts.values, textposition="outside")
+    fig.update_layout(height=height, showlegend=False)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def conditions_treemap(filters):
+    """Treemap of the 30 most common cancer types in the filtered trials."""
+    cancer_treemap = column_counts(filters, "conditions").head(30).reset_index()
+    cancer_treemap.columns = ["condition", "count"]
+    fig = px.treemap(cancer_treemap, path=["condition"], values="count",
+                   color="count", color_continuous_scale="Greens",
+                   labels={"count": "Number of Trials"})
+    fig.update_layout(height=500)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def purpose_sponsor_heatmap(filters):
+    """Success rate per primary purpose x sponsor type cell with at least 3 known outcomes."""
+    # Create pivot table
+    heatmap_data = success_stats(filters, "primary_purpose", "org_class")
+    heatmap_data = heatmap_data[heatmap_data["count"] >= 3]
+    
+    # Pivot for heatmap
+    heatmap_pivot = heatmap_data.pivot(index="primary_purpose", columns="org_class", values="mean")
+    heatmap_pivot = heatmap_pivot.sort_index(axis=1)  # pivot keeps appearance order for categoricals
+    
+    fig = px.imshow(heatmap_pivot, 
+                  labels=dict(x="Sponsor Type", y="Primary Purpose", color="Success Rate"),
+                  color_continuous_scale="RdYlGn",
+                  aspect="auto")
+    fig.update_layout(height=500)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def purpose_success_bar(filters):
+    """Success rate of the 10 best primary purposes with at least 5 known outcomes."""
+    purpose_stats = success_stats(filters, "primary_purpose")
+    purpose_stats = purpose_stats[purpose_stats["count"] >= 5].nlargest(10, "mean")
+    fig = px.bar(purpose_stats, x="primary_purpose", y="mean", 
+               text=purpose_stats["mean"].apply(lambda x: f"{x:.0%}"),
+               color="mean", color_continuous_scale="RdYlGn")
+    fig.update_yaxes(tickformat=".0%", title="Success Rate")
+    fig.update_xaxes(title="Primary Purpose")
+    fig.update_traces(textposition="outside")
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def sponsor_success_bar(filters):
+    """Success rate per sponsor type, best first."""
+    sponsor_stats = success_stats(filters, "org_class").sort_values("mean", ascending=False)
+    fig = px.bar(sponsor_stats, x="org_class", y="mean", 
+               text=sponsor_stats["mean"].apply(lambda x: f"{x:.0%}"),
+               color="mean", color_continuous_scale="Viridis",
+               labels={"org_class": "Sponsor Type", "mean": "Success Rate"})
+    fig.update_yaxes(tickformat=".0%")
+    fig.update_traces(textposition="outside")
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def sponsor_volume_bar(filters):
+    """Trial count of the 10 most common sponsor types."""
+    sponsor_counts = column_counts(filters, "org_class").head(10)
+    fig = px.bar(x=sponsor_counts.index, y=sponsor_counts.values,
+               labels={"x": "Sponsor Type", "y": "Number of Trials"},
+               color=sponsor_counts.values, color_continuous_scale="Blues")
+    fig.update_traces(text=sponsor_counts.values, textposition="outside")
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def intervention_success_bar(filters):
+    """Success rate of the 15 interventions with the most known outcomes."""
+    intervention_success = success_stats(filters, "interventions").nlargest(15, "count").sort_index()
+    intervention_success = intervention_success.sort_values("mean", ascending=True)
+    
+    fig = px.bar(intervention_success, y="interventions", x="mean", orientation="h",
+               text=intervention_success["mean"].apply(lambda x: f"{x:.0%}"),
+               color="mean", color_continuous_scale="RdYlGn",
+               labels={"mean": "Success Rate", "interventions": "Intervention"})
+    fig.update_xaxes(tickformat=".0%")
+    fig.update_traces(textposition="outside")
+    fig.update_layout(height=500)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def cancer_success_bar(filters):
+    """Success rate of the 15 lowest-scoring cancer types with at least 5 known outcomes."""
+    condition_stats = success_stats(filters, "conditions")
+    cancer_stats = condition_stats[condition_stats["count"] >= 5].nsmallest(15, "mean")
+    fig = px.bar(cancer_stats, y="conditions", x="mean", orientation="h",
+               text=cancer_stats["mean"].apply(lambda x: f"{x:.0%}"),
+               color="mean", color_continuous_scale="Viridis",
+               labels={"conditions": "Cancer Type", "mean": "Success Rate"})
+    fig.update_xaxes(tickformat=".0%", title="Success Rate")
+    fig.update_yaxes(title="")
+    fig.update_traces(textposition="outside")
+    fig.update_layout(height=600, showlegend=False)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def combination_success_bar(filters):
+    """Success rate of combination vs single-agent trials."""
+    combo_stats = combination_stats(filters)
+    fig = px.bar(combo_stats, x="therapy_type", y="mean",
+               text=combo_stats["mean"].apply(lambda x: f"{x:.0%}"),
+               color="mean", color_continuous_scale="RdYlGn",
+               labels={"therapy_type": "Therapy Type", "mean": "Success Rate"})
+    fig.update_yaxes(tickformat=".0%")
+    fig.update_traces(textposition="outside")
+    fig.update_layout(height=400)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def keyword_bar(filters, n):
+    """Horizontal bar chart of the n most common intervention keywords."""
+    top_keywords = keyword_counts(filters, n)
+    fig = px.bar(top_keywords, y="keyword", x="count", orientation="h",
+               color="count", color_continuous_scale="Plasma",
+               labels={"keyword": "Keyword", "count": "Frequency"})
+    fig.update_layout(height=600, showlegend=False)
+    fig.update_traces(textposition="outside", text=top_keywords["count"])
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def phase2_success_bar(filters):
+    """Success rate per Phase II status with at least 5 known outcomes, best first."""
+    phase2_success = success_stats(filters, "phase2_status")
+    phase2_success = phase2_success[phase2_success["count"] >= 5].sort_values("mean", ascending=False)
+    fig = px.bar(phase2_success, x="phase2_status", y="mean",
+               text=phase2_success["mean"].apply(lambda x: f"{x:.0%}"),
+               color="mean", color_continuous_scale="RdYlGn",
+               labels={"phase2_status": "Phase II Status", "mean": "Success Rate"})
+    fig.update_yaxes(tickformat=".0%")
+    fig.update_traces(textposition="outside")
+    fig.update_layout(height=400)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def organization_success_bar(filters):
+    """Best 10 success rates among the 15 organizations with the most known outcomes (at least 3)."""
+    org_success = success_stats(filters, "organization_name").nlargest(15, "count").sort_index()
+    org_success = org_success[org_success["count"] >= 3].nlargest(10, "mean")
+    fig = px.bar(org_success, x="organization_name", y="mean",
+               text=org_success["mean"].apply(lambda x: f"{x:.0%}"),
+               color="mean", color_continuous_scale="Viridis",
+               labels={"organization_name": "Organization", "mean": "Success Rate"})
+    fig.update_yaxes(tickformat=".0%")
+    fig.update_xaxes(tickangle=-45)
+    fig.update_traces(textposition="outside")
+    fig.update_layout(height=450)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def length_success_bar(filters):
+    """Success rate per intervention-name length bucket."""
+    length_success = length_stats(filters)
+    fig = px.bar(length_success, x="length_category", y="mean",
+               text=length_success["mean"].apply(lambda x: f"{x:.0%}"),
+               color="mean", color_continuous_scale="Cividis",
+               labels={"length_category": "Intervention Name Length", "mean": "Success Rate"})
+    fig.update_yaxes(tickformat=".0%")
+    fig.update_traces(textposition="outside")
+    fig.update_layout(height=400)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def purpose_diversity_bar(filters):
+    """Number of distinct primary purposes per sponsor type."""
+    fig = px.bar(purpose_diversity(filters), x="org_class", y="num_purposes",
+               text="num_purposes",
+               color="num_purposes", color_continuous_scale="Sunset",
+               labels={"org_class": "Sponsor Type", "num_purposes": "Number of Different Purposes"})
+    fig.update_traces(textposition="outside")
+    fig.update_layout(height=400, showlegend=False)
+    return fig
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def success_stats(filters, *columns):
+    """
+    Success rate per group of the filtered trials with a known outcome.
+    
+    Cached per (filters, columns), so tabs grouping by the same column share
+    one groupby and only a filter change recomputes it.
+    
+    Returns:
+        pd.DataFrame with the group columns plus mean, count and std
+    """
+    filtered = apply_filters(*filters)
+    known = filtered[filtered["outcome_known"]]
+    # observed=True: only groups that occur (the columns are categorical)
+    return known.groupby(list(columns), observed=True)["actual_success"].agg(["mean", "count", "std"]).reset_index()
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def yearly_counts(filters):
+    """Number of filtered trials per start year, oldest first (undated trials are left out)."""
+    return column_counts(filters, "year").sort_index().reset_index()
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def sponsor_yearly_counts(filters, n):
+    """Trials per start year for the n sponsor types with the most dated trials."""
+    df_dates = apply_filters(*filters).dropna(subset=["year"])
+    sponsor_yearly = df_dates.groupby(["year", "org_class"], observed=True).size().reset_index(name="count")
+    top_sponsors = df_dates["org_class"].value_counts().head(n).index
+    return sponsor_yearly[sponsor_yearly["org_class"].isin(top_sponsors)]
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def combination_stats(filters):
+    """Success rate and count of known outcomes for combination vs single-agent trials."""
+    filtered = apply_filters(*filters)
+    known = filtered[filtered["outcome_known"]]
+    is_combination = combination_mask(filters[0]).loc[known.index]
+    combo_stats = known.groupby(is_combination)["actual_success"].agg(["mean", "count"]).reset_index()
+    combo_stats["therapy_type"] = combo_stats["is_combination"].map({True: "Combination", False: "Single Agent"})
+    return combo_stats
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def length_stats(filters):
+    """Success rate per intervention-name length bucket, empty buckets included."""
+    filtered = apply_filters(*filters)
+    known = filtered[filtered["outcome_known"]]
+    # The one groupby left at observed=False: four fixed buckets, and the chart
+    # should show all of them even when a filter empties one
+    return known.groupby("length_category", observed=False)["actual_success"].agg(["mean", "count"]).reset_index()
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def purpose_diversity(filters):
+    """Number of distinct primary purposes per sponsor type, most diverse first."""
+    diversity = apply_filters(*filters).groupby("org_class", observed=True)["primary_purpose"].nunique().reset_index()
+    diversity.columns = ["org_class", "num_purposes"]
+    return diversity.sort_values("num_purposes", ascending=False)
@@ -1,8 +1,46 @@
 """
 Load and process real historical trial data for the dashboard.
 """
+import numpy as np
 import pandas as pd
 import os
+import tempfile
+
+# Source columns read from the pairs CSV ('Unnamed: 0' is the index that
+# build_pairs.py wrote out); the rest of the file is never used here
+CSV_COLUMNS = [
+    'Unnamed: 0',
+    'Organization Full Name',
+    'Organization Class',
+    'Brief Title',
+    'Conditions',
+    'Interventions_clean',
+    'Primary Purpose',
+    'Outcome Measure',
+    'Start Date',
+    'Overall Status_ph2',
+    'Overall Status_ph3',
+    'label_success',
+]
+
+# Repeated labels stored as category codes: groupby, value_counts and isin
+# on these work on small integers instead of hashing Python strings
+CATEGORICAL_COLUMNS = [
+    'organization_name',
+    'org_class',
+    'conditions',
+    'primary_purpose',
+    'phase2_status',
+    'phase3_status',
+    'outcome_label',
+]
+
+# Free-text columns the dashboard searches; Arrow-backed so str.contains
+# and friends run as pyarrow.compute kernels instead of per-row Python
+TEXT_COLUMNS = [
+    'interventions',
+    'brief_title',
+]
 
 
 def load_historical_trials(data_path="data/phase2_phase3_pairs.csv"):
@@ -13,7 +51,7 @@ def load_historical_trials(data_path="data/phase2_phase3_pairs.csv"):
         pd.DataFrame with processed trial data and outcome information
     """
     # Load the CSV data
-    df = pd.read_csv(data_path)
+    df = _cached_parquet(data_path)
     
     # Create a clean dataframe with relevant columns
     processed_df = pd.DataFrame({
@@ -36,23 +74,86 @@ def load_historical_trials(data_path="data/phase2_phase3_pairs.csv"):
     processed_df['outcome_known'] = processed_df['actual_success'].notna()
     
     # Create a readable success label
-    def format_outcome(row):
-        if pd.isna(row['actual_success']):
-            return 'Unknown'
-        elif row['actual_success'] == 1:
-            return '✅ Success'
-        else:
-            return '⚠️ Failure'
-    
-    processed_df['outcome_label'] = processed_df.apply(format_outcome, axis=1)
+    success = processed_df['actual_success'].to_numpy(dtype=float)
+    processed_df['outcome_label'] = np.where(
+        np.isnan(success), 'Unknown', np.where(success == 1, '✅ Success', '⚠️ Failure')
+    )
     
     # Fill NaN values for display
-    processed_df['interventions'] = processed_df['interventions'].fillna('Unknown')
-    processed_df['conditions'] = processed_df['conditions'].fillna('Unknown')
-    processed_df['primary_outcome'] = processed_df['primary_outcome'].fillna('Unknown')
-    processed_df['brief_title'] = processed_df['brief_title'].fillna('Unknown')
-    processed_df['start_date'] = processed_df['start_date'].fillna('Unknown')
-    processed_df['org_class'] = processed_df['org_class'].fillna('UNKNOWN')
-    processed_df['primary_purpose'] = processed_df['primary_purpose'].fillna('Unknown')
+    processed_df = processed_df.fillna({
+        'interventions': 'Unknown',
+        'conditions': 'Unknown',
+        'primary_outcome': 'Unknown',
+        'brief_title': 'Unknown',
+        'start_date': 'Unknown',
+        'org_class': 'UNKNOWN',
+        'primary_purpose': 'Unknown',
+    })
+    
+    # Parse start dates once (the CSV mixes YYYY-MM and YYYY-MM-DD)
+    processed_df['parsed_date'] = pd.to_datetime(processed_df['start_date'], errors='coerce', format='ISO8601')
+    processed_df['year'] = processed_df['parsed_date'].dt.year.astype('Int16')
+    
+    # Intervention name length buckets for the dashboard's length chart
+    processed_df['intervention_length'] = processed_df['interventions'].str.len().astype('int32')
+    processed_df['length_category'] = pd.cut(processed_df['intervention_length'],
+                                             bins=[0, 20, 40, 60, 1000],
+                                             labels=['Short', 'Medium', 'Long', 'Very Long'])
+    
+    # Row numbers from the source CSV; int32 halves the column the table ships
+    processed_df['trial_index'] = processed_df['trial_index'].astype('int32')
+    for col in CATEGORICAL_COLUMNS:
+        processed_df[col] = processed_df[col].astype('category')
+    for col in TEXT_COLUMNS:
+        processed_df[col] = processed_df[col].astype('string[pyarrow]')
     
     return processed_df
+
+
+def _cached_parquet(data_path):
+    """
+    Read the used CSV columns through a Parquet copy kept next to the CSV.
+    
+    The copy is rewritten whenever the CSV is newer than it, it doesn't hold
+    exactly CSV_COLUMNS, or it can't be read; if it can't be written
+    (read-only checkout), the CSV is simply read every time.
+    """
+    parquet_path = os.path.splitext(data_path)[0] + '.parquet'
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(data_path):
+        try:
+            df = pd.read_parquet(parquet_path)
+        except Exception:  # truncated or otherwise unreadable copy: rebuild it
+            df = None
+        if df is not None and set(df.columns) == set(CSV_COLUMNS):
+            return df
+    
+    df = pd.read_csv(data_path, usecols=CSV_COLUMNS)
+    _write_parquet(df, parquet_path)
+    return df
+
+
+def _write_parquet(df, parquet_path):
+    """
+    Write the Parquet copy atomically, or not at all.
+    
+    Other workers may read the file at any moment, so it is written to a temp
+    file in the same directory and renamed into place; a reader sees either
+    the old copy or the complete new one, never a partial write.
+    """
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(parquet_path) or '.',
+            prefix='.' + os.path.basename(parquet_path) + '.',
+            suffix='.tmp',
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            df.to_parquet(f, engine='pyarrow', compression='snappy')
+        os.replace(tmp_path, parquet_path)
+    except OSError:
+        pass
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -6,14 +6,14 @@ import numpy as np
 import joblib
 import os
 
-def load_real_data_with_predictions(model_path="model.joblib", data_path="data/phase2_phase3_pairs.csv"):
+def load_real_data_with_predictions(model_path="model.pkl", data_path="data/phase2_phase3_pairs.csv", n=1000, seed=42):
     """
     Generate n realistic mock Phase II trials with predicted Phase III success probabilities.
     
     Returns:
         pd.DataFrame with columns matching the calculator inputs plus predictions
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     
     # Realistic interventions (oncology drugs and combinations)
     interventions = [
@@ -86,63 +86,58 @@ def load_real_data_with_predictions(model_path="model.joblib", data_path="data/p
     org_classes = ["INDUSTRY", "NIH", "NETWORK", "OTHER", "OTHER_GOV", "FED"]
     primary_purposes = ["TREATMENT", "PREVENTION", "SUPPORTIVE_CARE", "DIAGNOSTIC"]
     
-    # Generate trials
-    trials = []
-    for i in range(n):
-        intervention = np.random.choice(interventions)
-        condition = np.random.choice(cancer_types)
-        
-        # Create title
-        template = np.random.choice(title_templates)
-        brief_title = template.format(
-            intervention=intervention,
-            condition=condition
-        )
-        
-        # Create outcome
-        outcome_template = np.random.choice(outcome_templates)
-        months = np.random.choice([3, 6, 9, 12, 18, 24])
-        outcome = outcome_template.format(months=months)
-        
-        org_class = np.random.choice(org_classes, p=[0.6, 0.15, 0.1, 0.08, 0.05, 0.02])
-        primary_purpose = np.random.choice(primary_purposes, p=[0.85, 0.05, 0.05, 0.05])
-        
-        # Generate realistic probability
-        # Industry trials tend to have slightly higher success rates
-        # Immunotherapy tends to have higher success
-        base_prob = 0.35
-        
-        if org_class == "INDUSTRY":
-            base_prob += 0.10
-        elif org_class == "NIH":
-            base_prob += 0.05
-            
-        if any(drug in intervention for drug in ["Pembrolizumab", "Nivolumab", "Atezolizumab", "Durvalumab"]):
-            base_prob += 0.15
-            
-        if "Combination" in brief_title or "+" in intervention:
-            base_prob += 0.05
-            
-        # Add random variation
-        prob_success = np.clip(base_prob + np.random.normal(0, 0.15), 0.05, 0.95)
-        
+    # Generate trials (one draw per column rather than per trial)
+    intervention_idx = rng.integers(0, len(interventions), n)
+    intervention = np.asarray(interventions)[intervention_idx]
+    condition = np.asarray(cancer_types)[rng.integers(0, len(cancer_types), n)]
+    
+    # Create titles and outcomes
+    brief_title = np.array([
+        title_templates[t].format(intervention=i, condition=c)
+        for t, i, c in zip(rng.integers(0, len(title_templates), n), intervention, condition)
+    ])
+    months = rng.choice([3, 6, 9, 12, 18, 24], size=n)
+    outcome = [
+        outcome_templates[t].format(months=m)
+        for t, m in zip(rng.integers(0, len(outcome_templates), n), months)
+    ]
+    
+    org_class = rng.choice(org_classes, size=n, p=[0.6, 0.15, 0.1, 0.08, 0.05, 0.02])
+    primary_purpose = rng.choice(primary_purposes, size=n, p=[0.85, 0.05, 0.05, 0.05])
+    
+    # Generate realistic probability
+    # Industry trials tend to have slightly higher success rates
+    # Immunotherapy tends to have higher success
+    base_prob = np.full(n, 0.35)
+    base_prob += 0.10 * (org_class == "INDUSTRY")
+    base_prob += 0.05 * (org_class == "NIH")
+    
+    # Per-drug flags, looked up by each trial's drawn index
+    immunotherapy = np.array([
+        any(drug in name for drug in ["Pembrolizumab", "Nivolumab", "Atezolizumab", "Durvalumab"])
+        for name in interventions
+    ])
+    base_prob += 0.15 * immunotherapy[intervention_idx]
+    
+    combination = np.array(["+" in name for name in interventions])[intervention_idx]
+    combination |= np.char.find(brief_title, "Combination") >= 0
+    base_prob += 0.05 * combination
+    
+    # Add random variation
+    prob_success = np.clip(base_prob + rng.normal(0, 0.15, n), 0.05, 0.95)
+    
+    df = pd.DataFrame({
+        "trial_id": [f"NCT{x:08d}" for x in rng.integers(10000000, 99999999, n)],
+        "intervention": intervention,
+        "brief_title": brief_title,
+        "conditions": condition,
+        "primary_outcome": outcome,
+        "org_class": org_class,
+        "primary_purpose": primary_purpose,
+        "predicted_probability": prob_success,
         # Determine predicted label (threshold at 0.5)
-        predicted_success = 1 if prob_success >= 0.5 else 0
-        
-        trial = {
-            "trial_id": f"NCT{np.random.randint(10000000, 99999999):08d}",
-            "intervention": intervention,
-            "brief_title": brief_title,
-            "conditions": condition,
-            "primary_outcome": outcome,
-            "org_class": org_class,
-            "primary_purpose": primary_purpose,
-            "predicted_probability": prob_success,
-            "predicted_success": predicted_success,
-        }
-        trials.append(trial)
-    
-    df = pd.DataFrame(trials)
+        "predicted_success": (prob_success >= 0.5).astype(int),
+    })
     
     # Sort by probability descending for better initial view
     df = df.sort_values("predicted_probability", ascending=False).reset_index(drop=True)
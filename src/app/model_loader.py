@@ -0,0 +1,152 @@
+"""
+Load the trained Phase III success model once per Streamlit worker.
+"""
+import gc
+import os
+import re
+import stat
+
+import streamlit as st
+
+from src.app.serving import submit
+
+# RAM-backed staging area shared by every worker on the host
+SHARED_DIR = "/dev/shm/phaseforward"
+
+# First usable path wins: a RAM-backed .npy/JSON copy shared by every worker
+# on the host (if staged), then the repo's export, then the sklearn pickle.
+# Pickles are never read from shared memory: loading one runs its code
+MODEL_PATHS = [
+    os.path.join(SHARED_DIR, "model"),
+    "model",
+    "model.pkl",
+]
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Categorical inputs the model was trained on (shown in the calculator selectboxes)
+ORG_CLASSES = [
+    "INDUSTRY",
+    "NIH",
+    "NETWORK",
+    "OTHER",
+    "OTHER_GOV",
+    "UNKNOWN",
+    "FED",
+    "INDIV",
+]
+
+PRIMARY_PURPOSES = [
+    "TREATMENT",
+    "PREVENTION",
+    "DIAGNOSTIC",
+    "HEALTH_SERVICES_RESEARCH",
+    "SCREENING",
+    "SUPPORTIVE_CARE",
+    "BASIC_SCIENCE",
+    "OTHER",
+    "ECT",
+    "Unknown",
+]
+
+
+@st.cache_resource
+def get_model():
+    """
+    Load the trained model in its fast-scoring form.
+
+    Returns:
+        CompiledModel shared by every page of the app
+    """
+    path = next((p for p in MODEL_PATHS if _usable(p)), MODEL_PATHS[-1])
+    return _load_model(path)
+
+
+def _usable(path):
+    """
+    Whether a model path exists and can be trusted.
+
+    /dev/shm is world-writable, so a staged copy is only used when it and the
+    staging directory are real directories/files owned by this user that
+    nobody else can write to; otherwise another local user could plant one.
+    """
+    if not os.path.exists(path):
+        return False
+    if not path.startswith(SHARED_DIR + os.sep):
+        return True
+    for p in (SHARED_DIR, path):
+        info = os.lstat(p)  # lstat: a symlink planted by someone else is rejected
+        if stat.S_ISLNK(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o022:
+            return False
+    return True
+
+
+def _load_model(path):
+    """Load and warm up the model at path; get_model's st.cache_resource keeps the result."""
+    from src.model.compiled_model import CompiledModel
+    if os.path.isdir(path):
+        model = CompiledModel.load(path)
+    else:
+        import joblib
+        _prefetch(path)
+        model = CompiledModel.from_pipeline(joblib.load(path, mmap_mode="r"))
+
+    # Score a dummy row so one-time setup (tokenizer regex compile, page-ins
+    # of the mapped arrays) happens here rather than on the first user click
+    model.predict_proba(build_input("warm up", ORG_CLASSES[0], PRIMARY_PURPOSES[0]))
+    return model
+
+
+def _prefetch(path):
+    """Hint the kernel to read the model file ahead (no-op where unsupported)."""
+    if not hasattr(os, "posix_fadvise"):  # Windows / macOS
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Advice values are an enum, not flags, so they are issued separately
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def build_input(combined_text, org_class, primary_purpose):
+    """Wrap one trial's features as 1-element arrays keyed by training column."""
+    import numpy as np
+    return {
+        "combined_text": np.array([combined_text], dtype=object),
+        "Organization Class": np.array([org_class], dtype=object),
+        "Primary Purpose": np.array([primary_purpose], dtype=object),
+    }
+
+
+def combine_text(*fields):
+    """
+    Join the free-text inputs into the model's combined_text feature.
+
+    Collapses all whitespace in one pass; the tokenizer ignores it anyway, so
+    this only makes inputs that differ in spacing share a prediction cache entry.
+    """
+    return _WHITESPACE.sub(" ", " ".join(fields)).strip()
+
+
+@st.cache_data(max_entries=1024, ttl=3600)
+def predict_success(combined_text, org_class, primary_purpose):
+    """
+    Predict Phase III success for one set of calculator inputs.
+
+    Returns:
+        (probability of success, predicted label) as plain Python numbers
+    """
+    model = get_model()
+    proba = submit(model, build_input(combined_text, org_class, primary_purpose)).result()[0]
+    return float(proba[1]), int(model.classes_[proba.argmax()])
+
+
+def unload_model():
+    """Drop the cached model (and predictions made with it) so the next call reloads it."""
+    get_model.clear()
+    predict_success.clear()
+    gc.collect()
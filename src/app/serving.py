@@ -0,0 +1,88 @@
+"""
+Micro-batch prediction requests from concurrent sessions into single model calls.
+"""
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+MAX_BATCH = 32      # rows scored per model call
+MAX_WAIT = 0.02     # seconds to wait for more requests after the first
+
+_queue = queue.Queue()
+_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="prediction")
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def submit(model, features):
+    """
+    Queue a feature dict for scoring.
+
+    Returns:
+        concurrent.futures.Future resolving to the predict_proba rows
+    """
+    _ensure_worker()
+    future = Future()
+    _queue.put((model, features, future))
+    return future
+
+
+def _ensure_worker():
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run, name="prediction-batcher", daemon=True)
+            _worker.start()
+
+
+def _drain():
+    """Block for one request, then collect more until the batch or time window fills."""
+    items = [_queue.get()]
+    deadline = time.monotonic() + MAX_WAIT
+    while len(items) < MAX_BATCH:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            items.append(_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return items
+
+
+def _run():
+    while True:
+        items = _drain()
+
+        # Requests queued across a model reload must be scored by their own model
+        by_model = {}
+        for item in items:
+            by_model.setdefault(id(item[0]), []).append(item)
+
+        # Score on the pool so the next batch can be drained while this one runs
+        for group in by_model.values():
+            _executor.submit(_score, group)
+
+
+def _score(group):
+    import numpy as np
+
+    model = group[0][0]
+    try:
+        features = {
+            col: np.concatenate([item[1][col] for item in group])
+            for col in group[0][1]
+        }
+        proba = model.predict_proba(features)
+    except Exception as exc:
+        for _, _, future in group:
+            future.set_exception(exc)
+        return
+
+    start = 0
+    for _, item_features, future in group:
+        n_rows = len(next(iter(item_features.values())))
+        future.set_result(proba[start:start + n_rows])
+        start += n_rows
@@ -1,7 +1,38 @@
 import pandas as pd
 
+# Columns used below or carried into the pairs CSV ('Unnamed: 0' is the
+# trial index the dashboard reads); the export has many more
+COLUMNS = [
+    "Unnamed: 0",
+    "Organization Full Name",
+    "Organization Class",
+    "Responsible Party",
+    "Brief Title",
+    "Full Title",
+    "Overall Status",
+    "Start Date",
+    "Standard Age",
+    "Conditions",
+    "Primary Purpose",
+    "Interventions",
+    "Intervention Description",
+    "Study Type",
+    "Phases",
+    "Outcome Measure",
+    "Medical Subject Headings",
+]
+
+# Low-cardinality labels as categories: one copy of each string
+CATEGORIES = {
+    "Phases": "category",
+    "Overall Status": "category",
+    "Organization Class": "category",
+    "Primary Purpose": "category",
+    "Study Type": "category",
+}
+
 # 1. Load
-df = pd.read_csv("data/clin_trials.csv")
+df = pd.read_csv("data/clin_trials.csv", usecols=COLUMNS, dtype=CATEGORIES)
 print("Loaded:", df.shape)
 
 # 2. Look at unique phases first
@@ -13,8 +44,8 @@ onc = df[df["Medical Subject Headings"].str.contains("Neoplasm", case=False, na=
 print("Oncology subset:", onc.shape)
 
 # 4. Count Phase II / Phase III inside oncology
-is_phase2 = onc["Phases_clean"].str.contains("PHASE2")
-is_phase3 = onc["Phases_clean"].str.contains("PHASE3")
+is_phase2 = onc["Phases_clean"].str.contains("PHASE2", regex=False, na=False)
+is_phase3 = onc["Phases_clean"].str.contains("PHASE3", regex=False, na=False)
 print("Phase 2 oncology count:", is_phase2.sum())
 print("Phase 3 oncology count:", is_phase3.sum())
 
@@ -34,19 +65,11 @@ ph3["Interventions_clean"] = ph3["Interventions"].str.lower().str.strip()
 print("\nUnique Phase 2 interventions:", ph2["Interventions_clean"].nunique())
 print("Unique Phase 3 interventions:", ph3["Interventions_clean"].nunique())
 
-# 8. Find overlap
-common = set(ph2["Interventions_clean"]).intersection(set(ph3["Interventions_clean"]))
+# 8. Find overlap (count only: the inner merge below keeps just these)
+common = pd.Index(ph2["Interventions_clean"].unique()).intersection(ph3["Interventions_clean"].unique())
 print("Common interventions:", len(common))
 
-# 9. Filter down
-ph2 = ph2[ph2["Interventions_clean"].isin(common)]
-ph3 = ph3[ph3["Interventions_clean"].isin(common)]
-
-print("\nPairs after intersection:")
-print("Phase 2:", ph2.shape)
-print("Phase 3:", ph3.shape)
-
-# 10. Merge
+# 9. Merge
 merged = ph2.merge(
     ph3[["Interventions_clean", "Overall Status"]],
     on="Interventions_clean",
@@ -55,9 +78,9 @@ merged = ph2.merge(
 
 print("Merged pairs:", merged.shape)
 
-# 11. Label success
+# 10. Label success
 merged["label_success"] = (merged["Overall Status_ph3"] == "COMPLETED").astype(int)
 
-# 12. Save
+# 11. Save
 merged.to_csv("data/phase2_phase3_pairs.csv", index=False)
 print("\nSaved: data/phase2_phase3_pairs.csv")
@@ -1,24 +1,32 @@
 import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 
-df = pd.read_csv("data/phase2_phase3_pairs.csv")
+# Keep the file as a columnar Arrow table: the counts below run as Arrow
+# kernels and only the few rows actually printed are turned into DataFrames
+table = pa_csv.read_csv(
+    "data/phase2_phase3_pairs.csv",
+    convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+)
 
 print("\n=== BASIC SHAPE ===")
-print("Rows:", df.shape[0])
-print("Columns:", list(df.columns))
+print("Rows:", table.num_rows)
+print("Columns:", table.column_names)
 
 print("\n=== HEAD ===")
-print(df.head())
+print(table.slice(0, 5).to_pandas())
 
 print("\n=== NULL COUNTS ===")
-print(df.isnull().sum())
+print(pd.Series({name: table.column(name).null_count for name in table.column_names}))
 
 print("\n=== LABEL DISTRIBUTION ===")
-print(df["label_success"].value_counts())
-print("\n% Positive (success):", df["label_success"].mean())
+labels = table.column("label_success")
+print(labels.to_pandas().value_counts())
+print("\n% Positive (success):", pc.mean(labels).as_py())
 
 print("\n=== UNIQUE TRIAL FEATURES ===")
-print("Unique Phase values (raw):", df["Phases"].unique())
-print("Unique Phase 3 Status:", df["Overall Status_ph3"].unique())
+print("Unique Phase values (raw):", pc.unique(table.column("Phases")).to_pylist())
+print("Unique Phase 3 Status:", pc.unique(table.column("Overall Status_ph3")).to_pylist())
 
 print("\n=== SAMPLE PHASE 2 → PHASE 3 LINKS ===")
 sample_cols = [
@@ -28,4 +36,4 @@ sample_cols = [
     "label_success"
 ]
 
-print(df[sample_cols].sample(5, random_state=0))
+print(table.select(sample_cols).to_pandas().sample(5, random_state=0))
@@ -1,39 +1,55 @@
-import pandas as pd
-from collections import Counter
+import pyarrow.csv as pa_csv
 from sklearn.feature_extraction.text import TfidfVectorizer
 
-df = pd.read_csv("data/phase2_phase3_pairs.csv")
+DATA_PATH = "data/phase2_phase3_pairs.csv"
+
+# Only the columns analysed below are converted; the other columns are never
+# materialised (the header alone gives the full column list)
+all_columns = pa_csv.open_csv(DATA_PATH).schema.names
+table = pa_csv.read_csv(
+    DATA_PATH,
+    convert_options=pa_csv.ConvertOptions(include_columns=[
+        "label_success",
+        "Brief Title",
+        "Interventions_clean",
+        "Conditions",
+        "Organization Class",
+        "Primary Purpose",
+        "Study Type",
+    ]),
+)
+df = table.to_pandas()
 
 print("\n=== SHAPE ===")
-print(df.shape)
+print((len(df), len(all_columns)))
 
 print("\n=== COLUMN NAMES ===")
-print(df.columns.tolist())
+print(all_columns)
 
 # 1. Basic Label Distribution
 print("\n=== LABEL DISTRIBUTION ===")
 print(df["label_success"].value_counts(normalize=True))
 
 # 2. Text Lengths (Phase 2)
-df["title_len"] = df["Brief Title"].apply(lambda x: len(str(x)))
-df["interv_len"] = df["Interventions_clean"].apply(lambda x: len(str(x)))
-df["cond_len"] = df["Conditions"].apply(lambda x: len(str(x)))
+# Arrow reads these as non-null strings (empty stays ""), so the lengths
+# never see a missing value and fit int32
+text_lengths = {"title_len": "Brief Title", "interv_len": "Interventions_clean", "cond_len": "Conditions"}
+df = df.assign(**{name: df[column].str.len().astype("int32") for name, column in text_lengths.items()})
 
 print("\n=== TEXT LENGTH SUMMARY ===")
 print(df[["title_len", "interv_len", "cond_len"]].describe())
 
 # 3. Common Interventions
 print("\n=== MOST COMMON INTERVENTIONS ===")
-print(Counter(df["Interventions_clean"]).most_common(15))
+print(df["Interventions_clean"].value_counts().head(15))
 
 # 4. Common Conditions (diseases)
-all_conditions = []
-for c in df["Conditions"]:
-    parts = [x.strip().lower() for x in str(c).split(",")]
-    all_conditions.extend(parts)
+all_conditions = (
+    df["Conditions"].fillna("").str.lower().str.split(",").explode().str.strip()
+)
 
 print("\n=== MOST COMMON CONDITIONS ===")
-print(Counter(all_conditions).most_common(20))
+print(all_conditions.value_counts().head(20))
 
 # 5. Sponsor Types
 print("\n=== SPONSOR TYPE COUNT ===")
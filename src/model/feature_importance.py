@@ -22,7 +22,9 @@ all_features = np.concatenate([tfidf_features, cat_features])
 coefs = clf.coef_[0]
 
 # Top positive predictors (success ↑)
-top_pos_idx = np.argsort(coefs)[-20:][::-1]
+# argpartition selects the 20 in O(n); only those 20 get sorted
+top_pos_idx = np.argpartition(coefs, -20)[-20:]
+top_pos_idx = top_pos_idx[np.argsort(coefs[top_pos_idx])[::-1]]
 top_pos = [(all_features[i], coefs[i]) for i in top_pos_idx]
 
 print("\n=== TOP POSITIVE FEATURES (predict success) ===")
@@ -30,7 +32,8 @@ for name, coef in top_pos:
     print(f"{name:25s}  {coef:.4f}")
 
 # Top negative predictors (success ↓)
-top_neg_idx = np.argsort(coefs)[:20]
+top_neg_idx = np.argpartition(coefs, 20)[:20]
+top_neg_idx = top_neg_idx[np.argsort(coefs[top_neg_idx])]
 top_neg = [(all_features[i], coefs[i]) for i in top_neg_idx]
 
 print("\n=== TOP NEGATIVE FEATURES (predict failure) ===")
@@ -1,15 +1,26 @@
+import os
+
+import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import OneHotEncoder
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 from sklearn.compose import ColumnTransformer
-from sklearn.pipeline import Pipeline
+from sklearn.pipeline import Pipeline, make_pipeline
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score, roc_auc_score
 import joblib
 
+from compiled_model import CompiledModel
+
+DATA_PATH = "data/phase2_phase3_pairs.csv"
+
+# Fitted preprocessing + transformed matrices are cached here between runs
+CACHE_DIR = "cache"
+
 # Load data
-df = pd.read_csv("data/phase2_phase3_pairs.csv")
+df = pd.read_csv(DATA_PATH)
 
 label_col = "label_success"
 
@@ -34,12 +45,20 @@ X_train, X_test, y_train, y_test = train_test_split(
 )
 
 # Transformers
-text_tfidf = TfidfVectorizer(
-    stop_words="english",
-    max_features=5000,
+# Hashed TF-IDF: no vocabulary dict to pickle, just the IDF vector
+text_tfidf = make_pipeline(
+    HashingVectorizer(
+        stop_words="english",
+        n_features=2**13,
+        alternate_sign=False,
+        norm=None,
+        dtype=np.float32,
+    ),
+    TfidfTransformer(sublinear_tf=True),
 )
 
-cat_encoder = OneHotEncoder(handle_unknown="ignore")
+# float32 throughout so ColumnTransformer stacks the blocks without upcasting
+cat_encoder = OneHotEncoder(handle_unknown="ignore", dtype=np.float32)
 
 preprocess = ColumnTransformer(
     transformers=[
@@ -48,21 +67,60 @@ preprocess = ColumnTransformer(
     ]
 )
 
-# Build model pipeline
+# Transform once up front so the solver gets a float32 CSR matrix as-is.
+# Cached per unfitted transformer *and* the exact split it is fitted on (rows,
+# their order and the combined_text recipe all change the hash), so tuning the
+# classifier skips tokenizing but the cached rows always line up with y_train
+cache_dir = os.path.join(CACHE_DIR, joblib.hash((preprocess, X_train, X_test)))
+cache_files = {
+    "train": os.path.join(cache_dir, "X_train.npz"),
+    "test": os.path.join(cache_dir, "X_test.npz"),
+    "preprocess": os.path.join(cache_dir, "preprocess.joblib"),  # written last
+}
+if all(os.path.exists(p) for p in cache_files.values()):
+    print(f"Loading cached features from {cache_dir}/")
+    preprocess = joblib.load(cache_files["preprocess"])
+    X_train_features = sp.load_npz(cache_files["train"])
+    X_test_features = sp.load_npz(cache_files["test"])
+else:
+    print("Building features...")
+    X_train_features = preprocess.fit_transform(X_train).tocsr()
+    X_test_features = preprocess.transform(X_test).tocsr()
+
+    # preprocess.joblib goes last: a run interrupted mid-write leaves the
+    # entry incomplete, so the next run rebuilds it instead of loading it
+    os.makedirs(cache_dir, exist_ok=True)
+    sp.save_npz(cache_files["train"], X_train_features, compressed=False)
+    sp.save_npz(cache_files["test"], X_test_features, compressed=False)
+    joblib.dump(preprocess, cache_files["preprocess"])
+
+# Train
+print("Training model...")
+
+clf = LogisticRegression(
+    solver="saga",
+    max_iter=500,
+    tol=1e-3,
+    class_weight="balanced",
+    random_state=42,
+)
+clf.fit(X_train_features, y_train)
+
+# Both steps are fitted, so this is only the container the app loads
 model = Pipeline(
     steps=[
         ("preprocess", preprocess),
-        ("clf", LogisticRegression(max_iter=500, class_weight="balanced")),
+        ("clf", clf),
     ]
 )
 
-# Train
-print("Training model...")
-model.fit(X_train, y_train)
+# Store LR weights as float32 (halves their size; scoring upcasts as needed)
+clf.coef_ = clf.coef_.astype(np.float32)
+clf.intercept_ = clf.intercept_.astype(np.float32)
 
-# Evaluate
-y_pred = model.predict(X_test)
-y_prob = model.predict_proba(X_test)[:, 1]
+# Evaluate (on the precomputed test features; same result as model.predict)
+y_pred = clf.predict(X_test_features)
+y_prob = clf.predict_proba(X_test_features)[:, 1]
 
 acc = accuracy_score(y_test, y_pred)
 auc = roc_auc_score(y_test, y_prob)
@@ -71,6 +129,10 @@ print("\n=== UPDATED MODEL RESULTS ===")
 print(f"Accuracy: {acc:.3f}")
 print(f"ROC-AUC:  {auc:.3f}")
 
-# Save model
-joblib.dump(model, "model.joblib")
-print("\nSaved: model.joblib")
\ No newline at end of file
+# Save model (uncompressed so the app can memory-map it)
+joblib.dump(model, "model.pkl", compress=0, protocol=5)
+print("\nSaved: model.pkl")
+
+# Save the pickle-free serving copy the app loads
+CompiledModel.from_pipeline(model).save("model")
+print("Saved: model/")
\ No newline at end of file
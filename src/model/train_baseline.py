@@ -67,8 +67,8 @@ print(f"Accuracy: {acc:.3f}")
 print(f"ROC-AUC:  {auc:.3f}")
 
 
-# Save model
+# Save model (protocol 5, uncompressed, like model.pkl: cheap to write and load)
 import joblib
-joblib.dump(model, "baseline_model.joblib")
+joblib.dump(model, "baseline_model.joblib", compress=0, protocol=5)
 
 print("\nSaved: baseline_model.joblib")
\ No newline at end of file
@@ -18,9 +18,11 @@ cat_features = cat.get_feature_names_out()
 all_features = np.concatenate([tfidf_features, cat_features])
 coefs = clf.coef_[0]
 
-# Top + and - features
-top_pos_idx = np.argsort(coefs)[-10:][::-1]
-top_neg_idx = np.argsort(coefs)[:10]
+# Top + and - features (select with argpartition, then sort just those 10)
+top_pos_idx = np.argpartition(coefs, -10)[-10:]
+top_pos_idx = top_pos_idx[np.argsort(coefs[top_pos_idx])[::-1]]
+top_neg_idx = np.argpartition(coefs, 10)[:10]
+top_neg_idx = top_neg_idx[np.argsort(coefs[top_neg_idx])]
 
 feat_names = list(all_features[top_pos_idx]) + list(all_features[top_neg_idx])
 feat_values = list(coefs[top_pos_idx]) + list(coefs[top_neg_idx])